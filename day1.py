@@ -1,4 +1,8 @@
 import re
+import sys
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
 
 
 def read_input_file(file_name: str) -> list:
@@ -13,6 +17,50 @@ def process_rotation(rotation: str) -> tuple[str, int]:
     return letter, int(number)
 
 
+def parse_rotation_bytes(line: bytes) -> tuple[str, int]:
+    """
+    Parse a raw rotation line such as b'R42' without a regex: the first byte is
+    the direction, the remaining bytes are the number of clicks.
+    """
+    return chr(line[0]), int(line[1:])
+
+
+def iter_rotations_from_stream(stream: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[tuple[str, int]]:
+    """
+    Yield (direction, clicks) pairs from a binary stream, reading it in fixed
+    size chunks so memory use stays flat regardless of the file size.
+
+    Args:
+        stream (BinaryIO): An open binary file handle, e.g. sys.stdin.buffer.
+        chunk_size (int): Number of bytes read per chunk.
+    """
+    remainder = b''
+    while chunk := stream.read(chunk_size):
+        lines = (remainder + chunk).split(b'\n')
+        # The last piece may be a partial line; keep it for the next chunk
+        remainder = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield parse_rotation_bytes(line)
+
+    remainder = remainder.strip()
+    if remainder:
+        yield parse_rotation_bytes(remainder)
+
+
+def iter_rotations(file_name: str, chunk_size: int = 1 << 20) -> Iterator[tuple[str, int]]:
+    """
+    Stream the rotations of a file, or of stdin when file_name is '-'.
+    """
+    if file_name == '-':
+        yield from iter_rotations_from_stream(sys.stdin.buffer, chunk_size)
+        return
+
+    with open(file_name, 'rb') as f:
+        yield from iter_rotations_from_stream(f, chunk_size)
+
+
 def turn_dial(direction: str, start_position: int, rotation: int) -> int | None:
     if direction == 'L':
         return (start_position - rotation) % 100
@@ -40,31 +88,204 @@ def turn_dial_and_count(direction: str, start_position: int, rotation: int) -> t
     return pos, count
 
 
-def compute_part_one(file_name: str) -> str:
-    rotations = read_input_file(file_name)
+def turn_dial_and_count_closed_form(direction: str, start_position: int, rotation: int,
+                                    modulus: int = 100) -> tuple[int, int]:
+    """
+    Same result as `turn_dial_and_count`, but computed arithmetically in O(1).
+
+    Turning right from p, zero is hit once for every multiple of the modulus in
+    (p, p + rotation]. Turning left is the mirror image: the distance to the
+    first zero is (modulus - p) % modulus, measured in the other direction.
+
+    Args:
+        direction (str): 'L' or 'R'.
+        start_position (int): Current dial position, 0 <= start_position < modulus.
+        rotation (int): Number of clicks to turn.
+        modulus (int): Number of positions on the dial.
+
+    Returns:
+        tuple: (end_position, number_of_times_zero_was_hit)
+    """
+    if direction == 'R':
+        end = start_position + rotation
+        return end % modulus, end // modulus
+    elif direction == 'L':
+        mirrored = (modulus - start_position) % modulus
+        return (start_position - rotation) % modulus, (mirrored + rotation) // modulus
+    raise ValueError(f"Unknown direction: {direction}")
+
+
+def read_rotation_arrays(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read all rotations into two arrays: a boolean array that is True for 'L'
+    turns and an int64 array with the number of clicks.
+    """
+    rotations = [process_rotation(rotation) for rotation in read_input_file(file_name)]
+    is_left = np.array([direction == 'L' for direction, _ in rotations], dtype=bool)
+    clicks = np.array([number for _, number in rotations], dtype=np.int64)
+    return is_left, clicks
+
+
+def rotation_positions_and_passes(is_left: np.ndarray, clicks: np.ndarray,
+                                  start_position: int = 50,
+                                  modulus: int = 100) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of the part two loop over a whole rotation array.
+
+    The start position of every rotation follows from a cumulative sum of the
+    signed turns (reduced modulo the dial first, so it cannot overflow), after
+    which the closed-form count is applied to all rotations at once.
+
+    Returns:
+        tuple: (position_after_each_rotation, zero_hits_of_each_rotation)
+    """
+    steps = np.where(is_left, -clicks, clicks) % modulus
+    positions = (start_position + np.cumsum(steps)) % modulus
+    starts = np.concatenate(([start_position], positions[:-1]))
+
+    # (offset + clicks) // modulus, split up so it cannot overflow int64 for huge clicks
+    offset = np.where(is_left, (modulus - starts) % modulus, starts)
+    passes = clicks // modulus + (offset + clicks % modulus) // modulus
+
+    return positions, passes
+
+
+def count_zero_passes_batch(is_left: np.ndarray, clicks: np.ndarray,
+                            start_position: int = 50, modulus: int = 100) -> tuple[int, int]:
+    """
+    Returns:
+        tuple: (end_position, total_number_of_times_zero_was_hit)
+    """
+    if len(clicks) == 0:
+        return start_position, 0
+
+    positions, passes = rotation_positions_and_passes(is_left, clicks, start_position, modulus)
+
+    # The total can exceed int64, so add the passes up as Python ints
+    return int(positions[-1]), sum(passes.tolist())
+
+
+def build_prefix_index(is_left: np.ndarray, clicks: np.ndarray, start_position: int = 50,
+                       modulus: int = 100) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build a prefix index over a rotation log so it can be queried without
+    replaying it.
+
+    All three arrays have one entry per rotation plus a leading entry for the
+    initial state, so entry k describes the dial after the first k rotations.
+
+    Returns:
+        tuple: (positions, cumulative_zero_stops, cumulative_zero_passes)
+               positions uses the smallest unsigned dtype that fits the dial,
+               the cumulative counts are int64, except the zero passes when
+               their total does not fit: those are kept as Python ints.
+    """
+    positions, passes = rotation_positions_and_passes(is_left, clicks, start_position, modulus)
+
+    positions = np.concatenate(([start_position], positions)).astype(np.min_scalar_type(modulus - 1))
+    cumulative_stops = np.concatenate(([0], np.cumsum(positions[1:] == 0))).astype(np.int64)
+
+    dtype = np.int64 if sum(passes.tolist()) <= np.iinfo(np.int64).max else object
+    cumulative_passes = np.concatenate(([0], np.cumsum(passes.astype(dtype)))).astype(dtype)
+
+    return positions, cumulative_stops, cumulative_passes
+
+
+def position_after(index: tuple[np.ndarray, np.ndarray, np.ndarray], k: int) -> int:
+    """Dial position after the first k rotations."""
+    positions, _, _ = index
+    return int(positions[k])
+
+
+def zero_stops_between(index: tuple[np.ndarray, np.ndarray, np.ndarray], i: int, j: int) -> int:
+    """Number of rotations i..j-1 (0-based) that end on zero (part one rule)."""
+    _, cumulative_stops, _ = index
+    return int(cumulative_stops[j] - cumulative_stops[i])
+
+
+def zero_passes_between(index: tuple[np.ndarray, np.ndarray, np.ndarray], i: int, j: int) -> int:
+    """Number of times zero is hit during rotations i..j-1 (part two rule)."""
+    _, _, cumulative_passes = index
+    return int(cumulative_passes[j] - cumulative_passes[i])
+
+
+def save_prefix_index(file_name: str, index: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+    positions, cumulative_stops, cumulative_passes = index
+    if cumulative_passes.dtype == object:
+        # Python ints beyond int64 are stored as decimal strings, so no pickling is needed
+        cumulative_passes = cumulative_passes.astype(str)
+    with open(file_name, 'wb') as f:
+        np.savez(f, positions=positions, cumulative_stops=cumulative_stops,
+                 cumulative_passes=cumulative_passes)
+
+
+def load_prefix_index(file_name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    with np.load(file_name) as data:
+        positions, cumulative_stops, cumulative_passes = (
+            data['positions'], data['cumulative_stops'], data['cumulative_passes'])
+    if cumulative_passes.dtype.kind == 'U':
+        cumulative_passes = np.array([int(count) for count in cumulative_passes], dtype=object)
+
+    return positions, cumulative_stops, cumulative_passes
+
+
+def count_zero_stops(rotations: Iterable[tuple[str, int]]) -> int:
     start_position: int = 50
     count_zero = 0
-    for rotation in rotations:
-        direction, rotation = process_rotation(rotation)
+    for direction, rotation in rotations:
         start_position = turn_dial(direction, start_position, rotation)
         if start_position == 0:
             count_zero += 1
 
-    return f'{count_zero= }'
+    return count_zero
 
 
-def compute_part_two(file_name: str) -> str:
-    rotations = read_input_file(file_name)
+def count_zero_passes(rotations: Iterable[tuple[str, int]]) -> int:
     start_position: int = 50
     total_passing = 0
-    for rotation in rotations:
-        direction, rotation = process_rotation(rotation)
-        start_position, count_zero = turn_dial_and_count(direction, start_position, rotation)
+    for direction, rotation in rotations:
+        start_position, count_zero = turn_dial_and_count_closed_form(direction, start_position, rotation)
         total_passing += count_zero
 
+    return total_passing
+
+
+def compute_part_one(file_name: str) -> str:
+    rotations = read_input_file(file_name)
+    count_zero = count_zero_stops(process_rotation(rotation) for rotation in rotations)
+
+    return f'{count_zero= }'
+
+
+def compute_part_two(file_name: str) -> str:
+    rotations = read_input_file(file_name)
+    total_passing = count_zero_passes(process_rotation(rotation) for rotation in rotations)
+
+    return f'{total_passing= }'
+
+
+def compute_part_one_streaming(file_name: str) -> str:
+    count_zero = count_zero_stops(iter_rotations(file_name))
+
+    return f'{count_zero= }'
+
+
+def compute_part_two_streaming(file_name: str) -> str:
+    total_passing = count_zero_passes(iter_rotations(file_name))
+
+    return f'{total_passing= }'
+
+
+def compute_part_two_numpy(file_name: str) -> str:
+    is_left, clicks = read_rotation_arrays(file_name)
+    _, total_passing = count_zero_passes_batch(is_left, clicks)
+
     return f'{total_passing= }'
 
 
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input1.txt')}")
     print(f"Part II: {compute_part_two('input/input1.txt')}")
+    print(f"Part II: {compute_part_two_numpy('input/input1.txt')}")
+    print(f"Part I: {compute_part_one_streaming('input/input1.txt')}")
+    print(f"Part II: {compute_part_two_streaming('input/input1.txt')}")
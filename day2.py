@@ -1,3 +1,8 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator
+
+
 def read_input_file(file_name: str) -> list:
     with open(file_name) as f:
         content = f.read().splitlines()
@@ -38,15 +43,197 @@ def is_valid_two(id_: int) -> bool:
     return True
 
 
+def block_repeat_bounds(left: int, right: int, length: int, block_length: int) -> tuple[int, int, int]:
+    """
+    Describe the numbers with exactly `length` digits in [left, right] that consist
+    of one `block_length` digit block repeated length // block_length times.
+
+    Such a number is block * (10^(length-b) + ... + 10^b + 1), so the valid blocks
+    form a contiguous range.
+
+    Returns:
+        tuple: (first_block, last_block, multiplier); first_block > last_block
+               when there are no such numbers.
+    """
+    multiplier = (10 ** length - 1) // (10 ** block_length - 1)
+    first = max(10 ** (block_length - 1), -(-left // multiplier))
+    last = min(10 ** block_length - 1, right // multiplier)
+
+    return first, last, multiplier
+
+
+def sum_block_repeats(left: int, right: int, length: int, block_length: int) -> int:
+    """
+    Sum of the numbers described by `block_repeat_bounds`, as an arithmetic series.
+    """
+    first, last, multiplier = block_repeat_bounds(left, right, length, block_length)
+    if first > last:
+        return 0
+
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def iter_doubled_ids(left: int, right: int) -> Iterator[tuple[int, range]]:
+    """
+    Yield, per even digit length, the invalid part one IDs in [left, right]:
+    numbers whose first half equals their second half.
+    Only the invalid IDs themselves are produced, the rest of the range is skipped.
+
+    Yields:
+        tuple: (digit_length, range_of_doubled_ids)
+    """
+    for length in range(len(str(left)), len(str(right)) + 1):
+        if length % 2:
+            continue
+        first, last, multiplier = block_repeat_bounds(left, right, length, length // 2)
+        yield length, range(first * multiplier, last * multiplier + 1, multiplier)
+
+
+def sum_doubled_ids(left: int, right: int) -> int:
+    """
+    Sum of the invalid part one IDs in [left, right], computed per digit length
+    with an arithmetic series instead of checking every ID.
+    """
+    return sum(
+        (ids[0] + ids[-1]) * len(ids) // 2
+        for _, ids in iter_doubled_ids(left, right)
+        if ids
+    )
+
+
+def mobius(n: int) -> int:
+    """Möbius function: 0 if n has a squared prime factor, else (-1)^(number of prime factors)."""
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def sum_repeated_ids(left: int, right: int) -> int:
+    """
+    Sum of the invalid part two IDs in [left, right]: numbers made of some block
+    repeated at least twice.
+
+    A number of length n is invalid when its primitive (smallest) period p is a
+    proper divisor of n. sum_block_repeats(..., n, d) counts every number whose
+    period divides d, so by Möbius inversion the numbers with primitive period
+    exactly n sum to sum over d | n of mu(n / d) * sum_block_repeats(..., n, d).
+    The invalid IDs are everything else, which leaves the terms with d < n:
+    each number is counted once, no matter how many periods it has.
+    """
+    total = 0
+    for length in range(len(str(left)), len(str(right)) + 1):
+        for block_length in range(1, length):
+            if length % block_length:
+                continue
+            total -= mobius(length // block_length) * sum_block_repeats(left, right, length, block_length)
+
+    return total
+
+
+def parse_ranges(line: str) -> list[tuple[int, int]]:
+    return [tuple(map(int, part.split('-'))) for part in line.split(',')]
+
+
+def merge_overlapping_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    """
+    Turn possibly overlapping ranges into disjoint segments, each with the number
+    of input ranges that cover it. Scanning the segments once and weighting by
+    that count gives the same total as scanning every input range separately.
+
+    Returns:
+        list: (left, right, multiplicity) tuples, sorted and non-overlapping.
+    """
+    # Coverage changes by +1 at a range start and by -1 just after its end
+    events = sorted([(left, 1) for left, _ in ranges] + [(right + 1, -1) for _, right in ranges])
+
+    segments = []
+    coverage = 0
+    previous = None
+    for position, delta in events:
+        if coverage and previous is not None and position > previous:
+            if segments and segments[-1][1] == previous - 1 and segments[-1][2] == coverage:
+                segments[-1] = (segments[-1][0], position - 1, coverage)
+            else:
+                segments.append((previous, position - 1, coverage))
+        coverage += delta
+        previous = position
+
+    return segments
+
+
+def split_into_shards(segments: list[tuple[int, int, int]], number_of_shards: int) -> list[list[tuple[int, int, int]]]:
+    """
+    Split weighted segments into shards that each hold about the same number of
+    IDs, cutting segments where needed.
+    """
+    total = sum(right - left + 1 for left, right, _ in segments)
+    shard_size = max(1, -(-total // number_of_shards))
+
+    shards = []
+    shard = []
+    room = shard_size
+    for left, right, weight in segments:
+        while left <= right:
+            end = min(right, left + room - 1)
+            shard.append((left, end, weight))
+            room -= end - left + 1
+            left = end + 1
+            if room == 0:
+                shards.append(shard)
+                shard = []
+                room = shard_size
+    if shard:
+        shards.append(shard)
+
+    return shards
+
+
+def sum_invalid_in_shard(shard: list[tuple[int, int, int]], is_valid: Callable[[int], bool]) -> int:
+    sum_invalid_id = 0
+    for left, right, weight in shard:
+        for id_ in range(left, right + 1):
+            if not is_valid(id_):
+                sum_invalid_id += weight * id_
+
+    return sum_invalid_id
+
+
+def sum_invalid_parallel(ranges: list[tuple[int, int]], is_valid: Callable[[int], bool],
+                         workers: int | None = None) -> int:
+    """
+    Check every ID in the ranges with `is_valid`, spread over a process pool.
+
+    Overlapping ranges are merged first so each ID is checked only once (but
+    still counted once per range that contains it), and the merged segments are
+    cut into balanced shards, a few per worker.
+
+    Args:
+        ranges (list): (left, right) tuples, inclusive.
+        is_valid (Callable): Module level predicate, e.g. is_valid_id or is_valid_two.
+        workers (int | None): Number of worker processes, None for os.cpu_count().
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = split_into_shards(merge_overlapping_ranges(ranges), 4 * workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(sum_invalid_in_shard, shards, [is_valid] * len(shards)))
+
+
 def compute_part_one(file_name: str) -> str:
     content = read_input_file(file_name)
     sum_invalid_id = 0
 
     for part in content[0].split(','):
         left, right = map(int, part.split('-'))
-        for id_ in range(left, right + 1):
-            if not is_valid_id(id_):
-                sum_invalid_id += id_
+        sum_invalid_id += sum_doubled_ids(left, right)
 
     return f"{sum_invalid_id=}"
 
@@ -57,9 +244,21 @@ def compute_part_two(file_name: str) -> str:
 
     for part in content[0].split(','):
         left, right = map(int, part.split('-'))
-        for id_ in range(left, right + 1):
-            if not is_valid_two(id_):
-                sum_invalid_id += id_
+        sum_invalid_id += sum_repeated_ids(left, right)
+
+    return f"{sum_invalid_id=}"
+
+
+def compute_part_one_parallel(file_name: str, workers: int | None = None) -> str:
+    content = read_input_file(file_name)
+    sum_invalid_id = sum_invalid_parallel(parse_ranges(content[0]), is_valid_id, workers)
+
+    return f"{sum_invalid_id=}"
+
+
+def compute_part_two_parallel(file_name: str, workers: int | None = None) -> str:
+    content = read_input_file(file_name)
+    sum_invalid_id = sum_invalid_parallel(parse_ranges(content[0]), is_valid_two, workers)
 
     return f"{sum_invalid_id=}"
 
@@ -67,3 +266,5 @@ def compute_part_two(file_name: str) -> str:
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input2.txt')}")
     print(f"Part II: {compute_part_two('input/input2.txt')}")
+    print(f"Part I: {compute_part_one_parallel('input/input2.txt')}")
+    print(f"Part II: {compute_part_two_parallel('input/input2.txt')}")
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def read_input_file(file_name: str) -> list:
     """
     Read a text file and return its contents as a list of lines.
@@ -38,13 +41,38 @@ def largest_digit_and_index(s):
     return best_digit, best_index
 
 
+def max_subsequence_number(bank: str, k: int) -> int:
+    """
+    Find the largest k-digit number that can be formed from the digits of a
+    bank string while keeping their original order.
+
+    A single pass with a monotonic stack: a smaller digit on the stack is
+    dropped when a larger one arrives, as long as enough digits remain to
+    still fill k positions.
+
+    Args:
+        bank (str): The bank string to analyze.
+        k (int): Number of digits to select, 1 <= k <= len(bank).
+
+    Returns:
+        int: The largest k-digit number.
+    """
+    can_drop = len(bank) - k
+    stack = []
+
+    for ch in bank:
+        while can_drop and stack and stack[-1] < ch:
+            stack.pop()
+            can_drop -= 1
+        stack.append(ch)
+
+    return int(''.join(stack[:k]))
+
+
 def return_joltage(bank: str) -> int:
     """
-    Compute the 'Joltage' of a bank string.
-    Joltage is formed by:
-      - Finding the largest digit in the string except the last character.
-      - Then finding the largest digit *after* that first digit.
-      - Combining both digits into a two-digit integer.
+    Compute the 'Joltage' of a bank string: the largest two-digit number formed
+    by two of its digits, in order.
 
     Args:
         bank (str): The bank string to analyze.
@@ -52,30 +80,87 @@ def return_joltage(bank: str) -> int:
     Returns:
         int: The computed Joltage value.
     """
-    # Find the largest digit in all but the last character
-    digit1, index1 = largest_digit_and_index(bank[:-1])
+    return max_subsequence_number(bank, 2)
 
-    # Find the largest digit after the first digit's position
-    digit2, _ = largest_digit_and_index(bank[index1 + 1:])
 
-    # Combine digits into a two-digit number
-    joltage = int(digit1 + digit2)
+def return_joltage_12_digits(bank: str) -> int:
+    return max_subsequence_number(bank, 12)
 
-    return joltage
 
+def build_range_max_table(bank: str) -> list[list[int]]:
+    """
+    Build a sparse table for range-maximum queries over the digits of a bank.
 
-def return_joltage_12_digits(bank: str) -> int:
-    digits = []
+    Each entry encodes a (digit, index) pair as digit * n + (n - 1 - index), so a
+    plain max() prefers the largest digit and, among equal digits, the first one.
+    Level j holds the maximum of every window of length 2^j.
+
+    Args:
+        bank (str): The bank string to index.
+
+    Returns:
+        list: The sparse table, one list per level.
+    """
+    n = len(bank)
+    table = [[int(ch) * n + (n - 1 - i) for i, ch in enumerate(bank)]]
+
+    j = 1
+    while (1 << j) <= n:
+        previous = table[-1]
+        half = 1 << (j - 1)
+        table.append([max(previous[i], previous[i + half]) for i in range(n - (1 << j) + 1)])
+        j += 1
+
+    return table
+
+
+def range_max_digit_and_index(table: list[list[int]], start: int, stop: int) -> tuple[int, int]:
+    """
+    Same answer as `largest_digit_and_index(bank[start:stop])`, but in O(1) and
+    with the index relative to the whole bank.
+
+    Args:
+        table (list): Sparse table from `build_range_max_table`.
+        start (int): First index of the window.
+        stop (int): End of the window (exclusive), stop > start.
+
+    Returns:
+        tuple: (largest_digit, index_of_digit)
+    """
+    n = len(table[0])
+    level = (stop - start).bit_length() - 1
+    best = max(table[level][start], table[level][stop - (1 << level)])
+
+    return best // n, n - 1 - best % n
+
+
+def joltages_for_all_k(bank: str) -> list[int]:
+    """
+    Compute the best k-digit joltage of a bank for every k from 1 to len(bank).
+
+    The table is built once; each k then only needs k constant-time window
+    queries instead of rescanning the string.
 
-    for i in range(11, 0, -1):
-        digit, index = largest_digit_and_index(bank[:-i])
-        bank = bank[index + 1:]
-        digits.append(digit)
-    digit, _ = largest_digit_and_index(bank)
-    digits.append(digit)
-    joltage = int(''.join(digits))
+    Args:
+        bank (str): The bank string to analyze.
+
+    Returns:
+        list: Element k - 1 is the largest k-digit joltage.
+    """
+    table = build_range_max_table(bank)
+    n = len(bank)
+    joltages = []
 
-    return joltage
+    for k in range(1, n + 1):
+        digits = []
+        start = 0
+        for remaining in range(k, 0, -1):
+            digit, index = range_max_digit_and_index(table, start, n - remaining + 1)
+            digits.append(str(digit))
+            start = index + 1
+        joltages.append(int(''.join(digits)))
+
+    return joltages
 
 
 def compute_part_one(file_name: str) -> str:
@@ -118,6 +203,82 @@ def compute_part_two(file_name: str) -> str:
     return f'{total_joltage= }'
 
 
+def read_bank_matrix(file_name: str) -> np.ndarray:
+    """
+    Read all banks (which must have equal length) into a 2D array of digit
+    values with a single read.
+
+    Args:
+        file_name (str): Path to the input file.
+
+    Returns:
+        np.ndarray: uint8 matrix with one row per bank.
+
+    Raises:
+        ValueError: If the banks do not all have the same length.
+    """
+    with open(file_name, 'rb') as f:
+        data = f.read().replace(b'\r', b'').strip()
+
+    raw = np.append(np.frombuffer(data, dtype=np.uint8), np.uint8(ord('\n')))
+    width = data.index(b'\n') if b'\n' in data else len(data)
+    # Every row is followed by a newline byte, also the last one after the append
+    if len(raw) % (width + 1) != 0:
+        raise ValueError(f"Banks in {file_name} do not all have length {width}")
+    rows = raw.reshape(-1, width + 1)
+    if not (rows[:, width] == ord('\n')).all():
+        raise ValueError(f"Banks in {file_name} do not all have length {width}")
+
+    return rows[:, :width] - ord('0')
+
+
+def total_joltage_numpy(banks: np.ndarray, k: int) -> int:
+    """
+    Sum the best k-digit joltage of every bank, handling all banks at once.
+
+    For each of the k output digits the allowed window of every row is masked,
+    argmax picks the first largest digit per row, and the window start moves
+    past it. The total is accumulated per digit position as Python ints, so it
+    cannot overflow whatever k is.
+
+    Args:
+        banks (np.ndarray): Digit matrix from `read_bank_matrix`.
+        k (int): Number of digits to select per bank.
+
+    Returns:
+        int: The total joltage.
+    """
+    rows, width = banks.shape
+    columns = np.arange(width)
+    row_index = np.arange(rows)
+    start = np.zeros(rows, dtype=np.int64)
+    signed_banks = banks.astype(np.int16)
+    total_joltage = 0
+
+    for remaining in range(k, 0, -1):
+        window = (columns >= start[:, None]) & (columns <= width - remaining)
+        index = np.argmax(np.where(window, signed_banks, -1), axis=1)
+        digit_sum = int(banks[row_index, index].sum(dtype=np.int64))
+        total_joltage += digit_sum * 10 ** (remaining - 1)
+        start = index + 1
+
+    return total_joltage
+
+
+def compute_part_one_numpy(file_name: str) -> str:
+    total_joltage = total_joltage_numpy(read_bank_matrix(file_name), 2)
+
+    return f'{total_joltage= }'
+
+
+def compute_part_two_numpy(file_name: str) -> str:
+    total_joltage = total_joltage_numpy(read_bank_matrix(file_name), 12)
+
+    return f'{total_joltage= }'
+
+
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input3.txt')}")
     print(f"Part II: {compute_part_two('input/input3.txt')}")
+    print(f"Part I: {compute_part_one_numpy('input/input3.txt')}")
+    print(f"Part II: {compute_part_two_numpy('input/input3.txt')}")
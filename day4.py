@@ -1,3 +1,5 @@
+import numpy as np
+
 DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, -1), (-1, 1), (1, 1), (-1, -1)]
 
 
@@ -17,6 +19,26 @@ def find_neighbours(x: int, y: int, grid: list) -> list:
     return neighbours
 
 
+def grid_to_array(grid: list) -> np.ndarray:
+    """Boolean array that is True where the grid holds a roll of paper ('@')."""
+    raw = np.frombuffer(''.join(grid).encode(), dtype=np.uint8)
+    return raw.reshape(len(grid), -1) == ord('@')
+
+
+def neighbour_count_map(occupied: np.ndarray) -> np.ndarray:
+    """
+    Number of occupied neighbours of every cell, computed by adding the eight
+    shifted copies of a zero-padded occupancy array.
+    """
+    height, width = occupied.shape
+    padded = np.pad(occupied.astype(np.uint8), 1)
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dx, dy in DIRECTIONS:
+        counts += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    return counts
+
+
 def compute_part_one(file_name: str) -> str:
     grid = read_input_file(file_name)
     number_accessible_by_forklift = 0
@@ -31,6 +53,13 @@ def compute_part_one(file_name: str) -> str:
     return f'{number_accessible_by_forklift= }'
 
 
+def compute_part_one_numpy(file_name: str) -> str:
+    occupied = grid_to_array(read_input_file(file_name))
+    number_accessible_by_forklift = int((occupied & (neighbour_count_map(occupied) < 4)).sum())
+
+    return f'{number_accessible_by_forklift= }'
+
+
 def compute_part_two(file_name: str) -> str:
     grid = read_input_file(file_name)
     # maze = [list(row) for row in grid]
@@ -59,6 +88,253 @@ def compute_part_two(file_name: str) -> str:
     return f'{count= }'
 
 
+def peel_removable(occupied: np.ndarray, threshold: int = 4) -> int:
+    """
+    Count how many rolls can be removed in total when a roll with fewer than
+    `threshold` neighbours may be taken away, repeated until nothing changes.
+
+    Removing a roll can only lower the counts of its neighbours, so instead of
+    rescanning the grid every round, the neighbour counts are kept up to date
+    and only the neighbours of removed rolls are checked again.
+    Each roll enters the worklist at most once, so the cost is linear in the
+    grid size. The order of removal does not change the final set.
+
+    Args:
+        occupied (np.ndarray): Boolean grid from `grid_to_array`.
+        threshold (int): A roll is removable with fewer than this many neighbours.
+
+    Returns:
+        int: Number of removed rolls.
+    """
+    height, width = occupied.shape
+    # Flat lists are much faster than numpy arrays for single element access
+    present = occupied.ravel().tolist()
+    counts = neighbour_count_map(occupied).ravel().tolist()
+
+    worklist = [i for i, (p, c) in enumerate(zip(present, counts)) if p and c < threshold]
+    queued = [False] * len(present)
+    for i in worklist:
+        queued[i] = True
+
+    removed = 0
+    while worklist:
+        i = worklist.pop()
+        present[i] = False
+        removed += 1
+
+        y, x = divmod(i, width)
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                j = ny * width + nx
+                counts[j] -= 1
+                if present[j] and not queued[j] and counts[j] < threshold:
+                    queued[j] = True
+                    worklist.append(j)
+
+    return removed
+
+
+def core_numbers(occupied: np.ndarray) -> np.ndarray:
+    """
+    Compute the core number of every roll: the highest threshold N for which
+    the roll is never removed under the "fewer than N neighbours" rule.
+
+    Uses a bucket queue on the current neighbour count (0 to 8): rolls are
+    taken out in order of their count, and a neighbour's count is only lowered
+    while it is still above the count of the roll being removed.
+
+    Args:
+        occupied (np.ndarray): Boolean grid from `grid_to_array`.
+
+    Returns:
+        np.ndarray: int8 grid with the core number of each roll, -1 for empty cells.
+    """
+    height, width = occupied.shape
+    present = occupied.ravel().tolist()
+    degree = neighbour_count_map(occupied).ravel().tolist()
+    core = [-1] * len(present)
+
+    buckets = [[] for _ in range(len(DIRECTIONS) + 1)]
+    for i, p in enumerate(present):
+        if p:
+            buckets[degree[i]].append(i)
+
+    for d, bucket in enumerate(buckets):
+        while bucket:
+            i = bucket.pop()
+            # Skip stale entries of rolls that moved to a lower bucket
+            if not present[i] or degree[i] != d:
+                continue
+            present[i] = False
+            core[i] = d
+
+            y, x = divmod(i, width)
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    j = ny * width + nx
+                    if present[j] and degree[j] > d:
+                        degree[j] -= 1
+                        buckets[degree[j]].append(j)
+
+    return np.array(core, dtype=np.int8).reshape(height, width)
+
+
+def removed_counts_by_threshold(core: np.ndarray) -> list[int]:
+    """
+    Element N is the number of rolls removed under the "fewer than N neighbours"
+    rule, for N from 0 to 9. Higher thresholds remove everything, like N = 9.
+    """
+    histogram = np.bincount(core[core >= 0], minlength=len(DIRECTIONS) + 1)
+    return [0] + np.cumsum(histogram).tolist()
+
+
+def count_removed(removed_counts: list[int], threshold: int) -> int:
+    return removed_counts[min(max(threshold, 0), len(removed_counts) - 1)]
+
+
+def removal_rounds(occupied: np.ndarray, threshold: int = 4) -> np.ndarray:
+    """
+    Round in which every roll is removed when the removal is done in rounds, as
+    in `compute_part_two`: a roll is removed in round r + 1 when it drops below
+    the threshold after round r. Only the neighbours of the rolls removed in a
+    round are checked for the next one.
+
+    Returns:
+        np.ndarray: int32 grid with the 1-based removal round, 0 for empty cells
+                    and rolls that are never removed.
+    """
+    height, width = occupied.shape
+    present = occupied.ravel().tolist()
+    counts = neighbour_count_map(occupied).ravel().tolist()
+    rounds = [0] * len(present)
+
+    frontier = [i for i, (p, c) in enumerate(zip(present, counts)) if p and c < threshold]
+    current_round = 0
+    while frontier:
+        current_round += 1
+        for i in frontier:
+            present[i] = False
+            rounds[i] = current_round
+
+        candidates = set()
+        for i in frontier:
+            y, x = divmod(i, width)
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    j = ny * width + nx
+                    counts[j] -= 1
+                    if present[j]:
+                        candidates.add(j)
+        frontier = [j for j in candidates if counts[j] < threshold]
+
+    return np.array(rounds, dtype=np.int32).reshape(height, width)
+
+
+def compute_part_two_incremental(file_name: str) -> str:
+    count = peel_removable(grid_to_array(read_input_file(file_name)))
+
+    return f'{count= }'
+
+
+def compute_part_two_cores(file_name: str, threshold: int = 4) -> str:
+    removed_counts = removed_counts_by_threshold(core_numbers(grid_to_array(read_input_file(file_name))))
+    count = count_removed(removed_counts, threshold)
+
+    return f'{count= }'
+
+
+def pack_row(row: str) -> int:
+    """Pack a grid row into an int bitset: bit x is set when row[x] is '@'."""
+    bits = row.translate(str.maketrans('@.x', '100'))
+    return int(bits[::-1], 2) if bits else 0
+
+
+def read_packed_grid(file_name: str) -> tuple[list[int], int]:
+    """
+    Read the grid line by line into one int bitset per row, without keeping
+    the rows as strings.
+
+    Returns:
+        tuple: (list_of_row_bitsets, width)
+    """
+    rows = []
+    width = 0
+    with open(file_name) as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line:
+                width = max(width, len(line))
+                rows.append(pack_row(line))
+
+    return rows, width
+
+
+def accessible_rows(rows: list[int], width: int, threshold: int = 4) -> list[int]:
+    """
+    For each row, the bitset of rolls with fewer than `threshold` neighbours.
+
+    The eight neighbour bitsets of a row come from the row above, the row itself
+    and the row below, shifted one column left and right. They are added up
+    bit-parallel into a 4-bit counter (b3 b2 b1 b0) per column with a chain of
+    half adders, so a whole row is handled with a few dozen int operations.
+    """
+    mask = (1 << width) - 1
+    result = []
+
+    for y, row in enumerate(rows):
+        above = rows[y - 1] if y > 0 else 0
+        below = rows[y + 1] if y + 1 < len(rows) else 0
+
+        b0 = b1 = b2 = b3 = 0
+        for plane in ((above << 1) & mask, above, above >> 1,
+                      (row << 1) & mask, row >> 1,
+                      (below << 1) & mask, below, below >> 1):
+            carry = b0 & plane
+            b0 ^= plane
+            carry, b1 = b1 & carry, b1 ^ carry
+            carry, b2 = b2 & carry, b2 ^ carry
+            b3 |= carry
+
+        # Columns whose neighbour count is at least `threshold`
+        enough = 0
+        for value in range(threshold, len(DIRECTIONS) + 1):
+            enough |= ((b0 if value & 1 else ~b0) & (b1 if value & 2 else ~b1)
+                       & (b2 if value & 4 else ~b2) & (b3 if value & 8 else ~b3))
+        result.append(row & ~enough & mask)
+
+    return result
+
+
+def compute_part_one_packed(file_name: str) -> str:
+    rows, width = read_packed_grid(file_name)
+    number_accessible_by_forklift = sum(row.bit_count() for row in accessible_rows(rows, width))
+
+    return f'{number_accessible_by_forklift= }'
+
+
+def compute_part_two_packed(file_name: str) -> str:
+    rows, width = read_packed_grid(file_name)
+    count = 0
+
+    while True:
+        removable = accessible_rows(rows, width)
+        removed = sum(row.bit_count() for row in removable)
+        if not removed:
+            break
+        count += removed
+        rows = [row & ~gone for row, gone in zip(rows, removable)]
+
+    return f'{count= }'
+
+
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input4.txt')}")
     print(f"Part II: {compute_part_two('input/input4.txt')}")
+    print(f"Part I: {compute_part_one_numpy('input/input4.txt')}")
+    print(f"Part II: {compute_part_two_incremental('input/input4.txt')}")
+    print(f"Part II: {compute_part_two_cores('input/input4.txt')}")
+    print(f"Part I: {compute_part_one_packed('input/input4.txt')}")
+    print(f"Part II: {compute_part_two_packed('input/input4.txt')}")
@@ -1,3 +1,14 @@
+import heapq
+import os
+import struct
+import tempfile
+from bisect import bisect_right
+from itertools import islice
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
 def read_and_parse_input_file(file_name: str) -> tuple[list[tuple[int, ...]], list[int]]:
     with open(file_name) as f:
         ranges_block, ids_block = f.read().strip().split("\n\n")
@@ -7,6 +18,15 @@ def read_and_parse_input_file(file_name: str) -> tuple[list[tuple[int, ...]], li
     return ranges, ids
 
 
+def read_ids(file_name: str) -> list[int]:
+    """Read only the ingredient IDs; the ranges block is skipped without parsing it."""
+    with open(file_name) as f:
+        for line in f:
+            if not line.strip():
+                break
+        return [int(line) for line in f if line.strip()]
+
+
 def is_fresh_ingredient(ranges: list, id_: int) -> bool:
     return any(left <= id_ <= right for left, right in ranges)
 
@@ -28,12 +48,145 @@ def merge_ranges(ranges):
     return merged
 
 
+def build_range_index(ranges: list) -> tuple[list[int], list[int]]:
+    """Sorted start and end lists of the merged (disjoint) ranges."""
+    merged = merge_ranges(ranges)
+    return [start for start, _ in merged], [end for _, end in merged]
+
+
+def is_fresh_indexed(index: tuple[list[int], list[int]], id_: int) -> bool:
+    # The only range that can contain id_ is the last one starting at or before it
+    starts, ends = index
+    i = bisect_right(starts, id_) - 1
+    return i >= 0 and id_ <= ends[i]
+
+
+def count_fresh(index: tuple[list[int], list[int]], ids) -> int:
+    """Count the fresh IDs in a whole batch at once with np.searchsorted."""
+    starts, ends = index
+    if len(starts) == 0:
+        return 0
+    ids = np.asarray(ids, dtype=np.int64)
+    i = np.searchsorted(np.asarray(starts, dtype=np.int64), ids, side='right') - 1
+    ends = np.asarray(ends, dtype=np.int64)
+    return int(((i >= 0) & (ids <= ends[np.maximum(i, 0)])).sum())
+
+
+RANGE_INDEX_MAGIC = b'D5RANGES'
+RANGE_INDEX_HEADER = struct.Struct('<8sQ')
+
+
+def save_range_index(file_name: str, index: tuple[list[int], list[int]]) -> None:
+    """
+    Write a range index in a binary format that can be memory-mapped:
+    a header (magic bytes, number of ranges) followed by the starts and the
+    ends as little-endian int64 arrays.
+    """
+    starts, ends = index
+    with open(file_name, 'wb') as f:
+        f.write(RANGE_INDEX_HEADER.pack(RANGE_INDEX_MAGIC, len(starts)))
+        f.write(np.asarray(starts, dtype='<i8').tobytes())
+        f.write(np.asarray(ends, dtype='<i8').tobytes())
+
+
+def open_range_index(file_name: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Open a file written by `save_range_index` as two read-only memmaps, so
+    nothing is parsed or sorted and the pages are shared between processes.
+    """
+    with open(file_name, 'rb') as f:
+        magic, count = RANGE_INDEX_HEADER.unpack(f.read(RANGE_INDEX_HEADER.size))
+    if magic != RANGE_INDEX_MAGIC:
+        raise ValueError(f"Not a range index file: {file_name}")
+    if count == 0:
+        empty = np.empty(0, dtype='<i8')
+        return empty, empty
+
+    offset = RANGE_INDEX_HEADER.size
+    starts = np.memmap(file_name, dtype='<i8', mode='r', offset=offset, shape=(count,))
+    ends = np.memmap(file_name, dtype='<i8', mode='r', offset=offset + 8 * count, shape=(count,))
+    return starts, ends
+
+
+class IntervalSet:
+    """
+    Mutable set of integers stored as sorted, disjoint, non-adjacent ranges.
+
+    Ranges are kept in two parallel sorted lists (starts and ends) and located
+    with bisect, so membership is O(log n). Insert and delete find the affected
+    ranges with bisect and splice them in one slice assignment; the covered
+    count (the part two total) is updated as ranges change and is O(1).
+    """
+
+    def __init__(self, ranges=()):
+        self.starts = []
+        self.ends = []
+        self.total = 0
+        for start, end in ranges:
+            self.insert(start, end)
+
+    def insert(self, start: int, end: int) -> None:
+        # Ranges that overlap or touch [start, end] are absorbed into it
+        i = bisect_right(self.ends, start - 2)
+        j = bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.total -= count_range_values(zip(self.starts[i:j], self.ends[i:j]))
+
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.total += end - start + 1
+
+    def delete(self, start: int, end: int) -> None:
+        i = bisect_right(self.ends, start - 1)
+        j = bisect_right(self.starts, end)
+        if i >= j:
+            return
+
+        new_starts, new_ends = [], []
+        if self.starts[i] < start:
+            new_starts.append(self.starts[i])
+            new_ends.append(start - 1)
+        if self.ends[j - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[j - 1])
+
+        self.total -= count_range_values(zip(self.starts[i:j], self.ends[i:j]))
+        self.total += count_range_values(zip(new_starts, new_ends))
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def __contains__(self, id_: int) -> bool:
+        i = bisect_right(self.starts, id_) - 1
+        return i >= 0 and id_ <= self.ends[i]
+
+    def __len__(self) -> int:
+        return self.total
+
+    def ranges(self) -> list[list[int]]:
+        return [[start, end] for start, end in zip(self.starts, self.ends)]
+
+
 def compute_part_one(file_name: str) -> str:
     ranges, ids = read_and_parse_input_file(file_name)
     fresh_ingredient_count = sum(is_fresh_ingredient(ranges, id_) for id_ in ids)
     return f"{fresh_ingredient_count= }"
 
 
+def compute_part_one_indexed(file_name: str) -> str:
+    ranges, ids = read_and_parse_input_file(file_name)
+    fresh_ingredient_count = count_fresh(build_range_index(ranges), ids)
+    return f"{fresh_ingredient_count= }"
+
+
+def compute_part_one_mapped(index_file_name: str, file_name: str) -> str:
+    """Part one against a range index saved earlier with `save_range_index`."""
+    ids = read_ids(file_name)
+    fresh_ingredient_count = count_fresh(open_range_index(index_file_name), ids)
+    return f"{fresh_ingredient_count= }"
+
+
 def compute_part_two(file_name: str) -> str:
     ranges, _ = read_and_parse_input_file(file_name)
     merged = merge_ranges(ranges)
@@ -41,6 +194,84 @@ def compute_part_two(file_name: str) -> str:
     return f'{total = }'
 
 
+def compute_part_two_interval_set(file_name: str) -> str:
+    ranges, _ = read_and_parse_input_file(file_name)
+    total = len(IntervalSet(ranges))
+    return f'{total = }'
+
+
+def iter_ranges(file_name: str) -> Iterator[tuple[int, int]]:
+    """Stream the ranges block of the input file, one range at a time."""
+    with open(file_name) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                break
+            start, end = line.split("-")
+            yield int(start), int(end)
+
+
+def write_sorted_runs(ranges: Iterable[tuple[int, int]], directory: str, chunk_size: int) -> list[str]:
+    """
+    Sort the ranges in chunks of at most `chunk_size` and write every sorted
+    chunk to its own run file in `directory`.
+    """
+    run_files = []
+    ranges = iter(ranges)
+    while chunk := sorted(islice(ranges, chunk_size)):
+        run_file = os.path.join(directory, f"run{len(run_files)}.txt")
+        with open(run_file, "w") as f:
+            f.writelines(f"{start}-{end}\n" for start, end in chunk)
+        run_files.append(run_file)
+
+    return run_files
+
+
+def iter_run(run_file: str) -> Iterator[tuple[int, int]]:
+    with open(run_file) as f:
+        for line in f:
+            start, end = line.split("-")
+            yield int(start), int(end)
+
+
+def iter_merged_ranges(sorted_ranges: Iterable[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+    """Streaming version of `merge_ranges` for input that is already sorted."""
+    current = None
+    for start, end in sorted_ranges:
+        if current is None:
+            current = [start, end]
+        elif start > current[1]:
+            yield current[0], current[1]
+            current = [start, end]
+        else:
+            current[1] = max(current[1], end)
+
+    if current is not None:
+        yield current[0], current[1]
+
+
+def count_range_values_external(file_name: str, chunk_size: int = 1_000_000) -> int:
+    """
+    Part two for range catalogues that do not fit in memory.
+
+    The ranges are sorted in chunks into temporary run files, the runs are
+    k-way merged with heapq.merge and the merged ranges are counted as they
+    stream by, so at most one chunk is held in memory.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        run_files = write_sorted_runs(iter_ranges(file_name), directory, chunk_size)
+        merged = iter_merged_ranges(heapq.merge(*(iter_run(run_file) for run_file in run_files)))
+        return count_range_values(merged)
+
+
+def compute_part_two_external(file_name: str, chunk_size: int = 1_000_000) -> str:
+    total = count_range_values_external(file_name, chunk_size)
+    return f'{total = }'
+
+
 if __name__ == "__main__":
     print(f"Part I: {compute_part_one('input/input5.txt')}")
     print(f"Part II: {compute_part_two('input/input5.txt')}")
+    print(f"Part I: {compute_part_one_indexed('input/input5.txt')}")
+    print(f"Part II: {compute_part_two_interval_set('input/input5.txt')}")
+    print(f"Part II: {compute_part_two_external('input/input5.txt')}")
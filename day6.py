@@ -1,5 +1,7 @@
 from math import prod
 
+import numpy as np
+
 
 def read_and_parse_input_file(file_name: str) -> tuple[list[list[int]], list[str]]:
     with open(file_name) as f:
@@ -29,6 +31,69 @@ def read_and_parse_input_file_two(file_name: str):
     return columns
 
 
+def read_worksheet_array(file_name: str) -> np.ndarray:
+    """
+    Read the worksheet as a 2D uint8 array of bytes, padded with spaces to the
+    widest row. Rows are copied in as whole byte strings, so no per-character
+    objects are created.
+    """
+    with open(file_name, 'rb') as f:
+        rows = [row.rstrip(b'\r') for row in f.read().rstrip(b'\r\n').split(b'\n')]
+
+    width = max(len(r) for r in rows)
+    sheet = np.full((len(rows), width), ord(' '), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        sheet[i, :len(row)] = np.frombuffer(row, dtype=np.uint8)
+
+    return sheet
+
+
+def decode_vertical_problems(sheet: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decode the cephalopod problems from a worksheet array.
+
+    Every non-space byte in the operator row (the last row) starts a block.
+    Each column inside a block holds one number, read top to bottom; the digit
+    rows are combined with column-wise array operations, and columns without
+    any digit (the separators) are dropped.
+
+    Returns:
+        tuple: (numbers, block_starts, operators)
+               numbers holds the numbers of all blocks one after another,
+               block_starts the index in numbers where each block begins and
+               operators the operator byte of each block.
+    """
+    digit_rows, operator_row = sheet[:-1], sheet[-1]
+
+    is_digit = (digit_rows >= ord('0')) & (digit_rows <= ord('9'))
+    numbers = np.zeros(sheet.shape[1], dtype=np.int64)
+    for row, row_is_digit in zip(digit_rows, is_digit):
+        numbers = np.where(row_is_digit, numbers * 10 + (row.astype(np.int64) - ord('0')), numbers)
+
+    # A column of up to 18 digits fits in int64; only longer columns are
+    # decoded again, exactly, as Python ints
+    digit_count = is_digit.sum(axis=0)
+    long_columns = np.flatnonzero(digit_count > 18)
+    if len(long_columns):
+        numbers = numbers.astype(object)
+        for col in long_columns:
+            numbers[col] = int(digit_rows[is_digit[:, col], col].tobytes())
+
+    # Like parse_math_two, only columns whose digits are contiguous hold a number
+    first_digit = np.argmax(is_digit, axis=0)
+    last_digit = len(digit_rows) - 1 - np.argmax(is_digit[::-1], axis=0)
+    is_number = (digit_count > 0) & (digit_count == last_digit - first_digit + 1)
+
+    block_start = operator_row != ord(' ')
+    block_id = np.cumsum(block_start) - 1
+    keep = is_number & (block_id >= 0)
+
+    numbers = numbers[keep]
+    block_starts = np.searchsorted(block_id[keep], np.arange(block_start.sum()))
+
+    return numbers, block_starts, operator_row[block_start]
+
+
 def parse_math(numbers: list[list[int]], operators: list[str]) -> int:
     total_sum = 0
 
@@ -79,12 +144,132 @@ def parse_math_two(rows: list) -> int:
     return total_sum
 
 
+def reduce_blocks(ufunc: np.ufunc, numbers: np.ndarray, block_starts: np.ndarray,
+                  lengths: np.ndarray, selected: np.ndarray) -> int:
+    """
+    Reduce the selected (non-empty) problems of an int64 array with `ufunc`
+    and return the sum of their results as a Python int.
+    """
+    if not selected.any():
+        return 0
+
+    values = numbers[np.repeat(selected, lengths)]
+    selected_lengths = lengths[selected]
+    starts = np.cumsum(selected_lengths) - selected_lengths
+
+    return sum(ufunc.reduceat(values, starts).tolist())
+
+
+def evaluate_problems(numbers: np.ndarray, block_starts: np.ndarray, operators: np.ndarray) -> int:
+    """
+    Evaluate many problems at once and return the sum of their results.
+
+    Whether a problem is safe on int64 is decided per problem, from an upper
+    bound on its result based on the bit length of every number. The safe
+    problems are grouped by operator and each group is reduced once, with
+    np.add.reduceat or np.multiply.reduceat; only the remaining problems are
+    evaluated with exact Python ints.
+
+    Args:
+        numbers (np.ndarray): The numbers of all problems one after another,
+                              int64 or object (Python ints).
+        block_starts (np.ndarray): Index in numbers where each problem begins.
+        operators (np.ndarray): Operator byte of each problem.
+
+    Returns:
+        int: The sum of all problem results.
+    """
+    block_ends = np.append(block_starts[1:], len(numbers)).astype(np.int64)
+    lengths = block_ends - block_starts
+    is_sum = operators == ord('+')
+    non_empty = lengths > 0
+
+    if numbers.dtype == object:
+        # Numbers of 2^62 and up make their problem unsafe anyway; the others
+        # are converted to int64 once, for the bounds and the reductions
+        fits = numbers < 2 ** 62
+        small_numbers = np.zeros(len(numbers), dtype=np.int64)
+        small_numbers[fits] = numbers[fits].astype(np.int64)
+    else:
+        fits = np.ones(len(numbers), dtype=bool)
+        small_numbers = numbers
+
+    # Bits needed per number, plus one for float rounding in log2
+    bits = np.where(fits, np.ceil(np.log2(small_numbers.astype(np.float64) + 1)) + 1, 64)
+
+    bits_per_block = np.zeros(len(block_starts))
+    if non_empty.any():
+        starts = block_starts[non_empty]
+        bits_per_block[non_empty] = np.where(
+            is_sum[non_empty],
+            np.maximum.reduceat(bits, starts) + np.ceil(np.log2(lengths[non_empty])),
+            np.add.reduceat(bits, starts),
+        )
+    safe = non_empty & (bits_per_block <= 62)
+
+    total_sum = reduce_blocks(np.add, small_numbers, block_starts, lengths, safe & is_sum)
+    total_sum += reduce_blocks(np.multiply, small_numbers, block_starts, lengths, safe & ~is_sum)
+
+    for start, end, op in zip(block_starts[~safe], block_ends[~safe], operators[~safe]):
+        column = [int(n) for n in numbers[start:end]]
+        if op == ord('+'):
+            total_sum += sum(column)
+        else:
+            total_sum += prod(column)
+
+    return total_sum
+
+
+def parse_math_array(numbers: list[list[int]], operators: list[str]) -> int:
+    total_sum = 0
+    operator_bytes = np.frombuffer(''.join(operators).encode(), dtype=np.uint8)
+
+    low, high = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+    if all(low <= min(row) and max(row) <= high for row in numbers):
+        values = np.array(numbers, dtype=np.int64)
+    else:
+        # Only the problems holding a number outside int64 are done with Python
+        # ints; their columns are then dropped from the array
+        huge = np.zeros(len(operators), dtype=bool)
+        rows = []
+        for row in numbers:
+            if low <= min(row) and max(row) <= high:
+                rows.append(np.array(row, dtype=np.int64))
+            else:
+                row = np.array(row, dtype=object)
+                out_of_range = (row < low) | (row > high)
+                huge |= out_of_range
+                row[out_of_range] = 0
+                rows.append(row.astype(np.int64))
+
+        huge_columns = np.flatnonzero(huge).tolist()
+        total_sum += parse_math([[row[j] for j in huge_columns] for row in numbers],
+                                [operators[j] for j in huge_columns])
+        values = np.stack(rows)[:, ~huge]
+        operator_bytes = operator_bytes[~huge]
+
+    # One problem per column: lay the columns out one after another
+    rows, problems = values.shape
+
+    return total_sum + evaluate_problems(values.T.ravel(), np.arange(problems) * rows, operator_bytes)
+
+
+def parse_math_two_array(sheet: np.ndarray) -> int:
+    return evaluate_problems(*decode_vertical_problems(sheet))
+
+
 def compute_part_one(file_name: str) -> str:
     numbers, operators = read_and_parse_input_file(file_name)
     total = parse_math(numbers, operators)
     return f'{total= }'
 
 
+def compute_part_one_array(file_name: str) -> str:
+    numbers, operators = read_and_parse_input_file(file_name)
+    total = parse_math_array(numbers, operators)
+    return f'{total= }'
+
+
 def compute_part_two(file_name: str) -> str:
     columns = read_and_parse_input_file_two(file_name)
     total = parse_math_two(columns)
@@ -92,6 +277,14 @@ def compute_part_two(file_name: str) -> str:
     return f'{total= }'
 
 
+def compute_part_two_array(file_name: str) -> str:
+    total = parse_math_two_array(read_worksheet_array(file_name))
+
+    return f'{total= }'
+
+
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input6.txt')}")
     print(f"Part II: {compute_part_two('input/input6.txt')}")
+    print(f"Part I: {compute_part_one_array('input/input6.txt')}")
+    print(f"Part II: {compute_part_two_array('input/input6.txt')}")
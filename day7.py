@@ -1,4 +1,8 @@
+import sys
 from collections import deque, defaultdict
+from typing import Iterable, Iterator
+
+import numpy as np
 
 
 def read_and_parse_input_file(file_name: str) -> list:
@@ -201,6 +205,231 @@ def process_manifold_dp(manifold: list) -> int:
     return sum(ways.values())
 
 
+def splitter_bits(row: list) -> int:
+    """Pack a manifold row into an int: bit x is set when row[x] is a splitter."""
+    return int(''.join('0' if cell == '.' else '1' for cell in reversed(row)), 2)
+
+
+def process_manifold_bitset(manifold: list) -> int:
+    """
+    Same result as `process_manifold_bfs`, computed a whole row at a time.
+
+    The columns holding a beam are kept as bits of a single int. Per row, the
+    beams that meet a splitter are `beams & splitters`; their number is the
+    count of newly reached splitters, and they continue one column to the left
+    and right (shifts), while the other beams continue straight down.
+
+    Args:
+        manifold (list): A 2D grid of characters representing the puzzle input.
+
+    Returns:
+        int: Number of distinct splitter cells reachable from the start.
+    """
+    width = len(manifold[0])
+    all_columns = (1 << width) - 1
+
+    beams = 1 << manifold[0].index('S')
+    splitters_hit = 0
+
+    for row in manifold[1:]:
+        splitters = splitter_bits(row)
+        hit = beams & splitters
+        splitters_hit += hit.bit_count()
+        beams = (beams & ~splitters) | ((hit << 1) & all_columns) | (hit >> 1)
+
+    return splitters_hit
+
+
+def splitter_masks(manifold: list) -> np.ndarray:
+    """Boolean array, one row per manifold row, True where the cell is a splitter."""
+    raw = np.frombuffer(''.join(''.join(row) for row in manifold).encode(), dtype=np.uint8)
+    return raw.reshape(len(manifold), -1) != ord('.')
+
+
+def advance_ways(ways: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Move the path counts of one row to the next row, whose splitters are given
+    by `mask`. Counts landing on a splitter move one column to the left and one
+    to the right (shifted additions), the others go straight down.
+
+    A row can at most double the total, so int64 counts are switched to
+    Python ints (object dtype) only once the total reaches 2^62.
+    """
+    if not mask.any():
+        return ways
+    if ways.dtype != object and ways.sum() >= 2 ** 62:
+        ways = ways.astype(object)
+
+    split = np.where(mask, ways, 0)
+    next_ways = np.where(mask, 0, ways)
+    next_ways[:-1] += split[1:]
+    next_ways[1:] += split[:-1]
+
+    return next_ways
+
+
+def process_manifold_rows(manifold: list) -> int:
+    """
+    Same result as `process_manifold_dp`, but with one count array per row
+    indexed by column instead of a dictionary keyed by coordinates.
+
+    Each row is advanced with `advance_ways`, using a splitter mask per row.
+
+    Args:
+        manifold (list): A 2D grid of characters representing the puzzle input.
+
+    Returns:
+        int: Total number of distinct paths that reach the bottom row.
+    """
+    masks = splitter_masks(manifold)
+
+    ways = np.zeros(masks.shape[1], dtype=np.int64)
+    ways[manifold[0].index('S')] = 1
+
+    for mask in masks[1:]:
+        ways = advance_ways(ways, mask)
+
+    return int(ways.sum())
+
+
+def process_manifold_all_starts(manifold: list) -> list[int]:
+    """
+    Count the paths to the bottom row for every possible start column at once.
+
+    Works bottom-up: every cell of the last row ends exactly one path, and the
+    number of paths from a cell is the number from the cell below it, or the
+    sum of the two diagonal cells below when the cell below is a splitter.
+    After one pass, the count for any start column is a plain lookup.
+
+    A row can at most double the largest count, so int64 counts are switched
+    to Python ints only once the largest count reaches 2^62.
+
+    Args:
+        manifold (list): A 2D grid of characters representing the puzzle input.
+
+    Returns:
+        list: Element x is the number of paths when starting in column x of the top row.
+    """
+    masks = splitter_masks(manifold)
+    width = masks.shape[1]
+
+    paths = np.ones(width, dtype=np.int64)
+
+    for mask in masks[:0:-1]:
+        if not mask.any():
+            continue
+        if paths.dtype != object and paths.max() >= 2 ** 62:
+            paths = paths.astype(object)
+
+        diagonal = np.zeros(width, dtype=paths.dtype)
+        diagonal[1:] += paths[:-1]
+        diagonal[:-1] += paths[1:]
+        paths = np.where(mask, diagonal, paths)
+
+    return [int(count) for count in paths]
+
+
+def iter_manifold_rows(file_name: str) -> Iterator[str]:
+    """Yield the manifold rows one at a time from a file, or from stdin when file_name is '-'."""
+    if file_name == '-':
+        for line in sys.stdin:
+            yield line.rstrip('\r\n')
+        return
+
+    with open(file_name) as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+def process_manifold_stream(rows: Iterable[str]) -> int:
+    """
+    Same result as `process_manifold_dp`, reading the manifold one row at a
+    time and keeping only the count vector of the current row, so memory is
+    proportional to the width and not to the height.
+
+    Args:
+        rows (Iterable): The manifold rows as strings, top row first.
+
+    Returns:
+        int: Total number of distinct paths that reach the bottom row.
+    """
+    rows = iter(rows)
+    top = next(rows)
+
+    ways = np.zeros(len(top), dtype=np.int64)
+    ways[top.index('S')] = 1
+
+    for row in rows:
+        if not row:
+            continue
+        mask = np.frombuffer(row.encode(), dtype=np.uint8) != ord('.')
+        ways = advance_ways(ways, mask)
+
+    return int(ways.sum())
+
+
+def enumerate_paths(manifold: list, node_budget: int) -> tuple[int | None, int]:
+    """
+    Count the paths like `process_manifold_bfs_two`, expanding every path
+    separately, but give up once more than `node_budget` nodes are expanded.
+
+    Returns:
+        tuple: (number_of_paths or None when the budget ran out, nodes_expanded)
+    """
+    height = len(manifold)
+    width = len(manifold[0])
+
+    queue = deque([manifold[0].index('S')])
+    nodes_expanded = 0
+
+    # Every queue entry is one path; the queue holds a single row at a time
+    for y in range(height - 1):
+        next_queue = deque()
+        for x in queue:
+            nodes_expanded += 1
+            if nodes_expanded > node_budget:
+                return None, nodes_expanded
+
+            if manifold[y + 1][x] == '.':
+                next_queue.append(x)
+            else:
+                if x > 0:
+                    next_queue.append(x - 1)
+                if x < width - 1:
+                    next_queue.append(x + 1)
+        queue = next_queue
+
+    return len(queue), nodes_expanded
+
+
+def count_paths_guarded(manifold: list, node_budget: int = 1_000_000) -> tuple[int, str, int]:
+    """
+    Count the paths through the manifold, choosing the engine automatically.
+
+    Path enumeration (`enumerate_paths`) is tried first, with a budget on the
+    number of nodes it may expand. If it runs out, the row DP
+    (`process_manifold_rows`) is used instead, which expands every cell of
+    every row below the top one exactly once.
+
+    Args:
+        manifold (list): A 2D grid of characters representing the puzzle input.
+        node_budget (int): Maximum number of nodes path enumeration may expand.
+
+    Returns:
+        tuple: (number_of_paths, engine, nodes_expanded), where engine is
+               'enumerate' or 'dp' and nodes_expanded includes the nodes of an
+               aborted enumeration.
+    """
+    all_paths, nodes_expanded = enumerate_paths(manifold, node_budget)
+    if all_paths is not None:
+        return all_paths, 'enumerate', nodes_expanded
+
+    all_paths = process_manifold_rows(manifold)
+    nodes_expanded += (len(manifold) - 1) * len(manifold[0])
+
+    return all_paths, 'dp', nodes_expanded
+
+
 def compute_part_one(file_name: str) -> str:
     manifold = read_and_parse_input_file(file_name)
     total = process_manifold_bfs(manifold)
@@ -208,6 +437,13 @@ def compute_part_one(file_name: str) -> str:
     return f'{total= }'
 
 
+def compute_part_one_bitset(file_name: str) -> str:
+    manifold = read_and_parse_input_file(file_name)
+    total = process_manifold_bitset(manifold)
+
+    return f'{total= }'
+
+
 def compute_part_two(file_name: str) -> str:
     manifold = read_and_parse_input_file(file_name)
     total = process_manifold_dp(manifold)
@@ -215,6 +451,30 @@ def compute_part_two(file_name: str) -> str:
     return f'{total= }'
 
 
+def compute_part_two_rows(file_name: str) -> str:
+    manifold = read_and_parse_input_file(file_name)
+    total = process_manifold_rows(manifold)
+
+    return f'{total= }'
+
+
+def compute_part_two_stream(file_name: str) -> str:
+    total = process_manifold_stream(iter_manifold_rows(file_name))
+
+    return f'{total= }'
+
+
+def compute_part_two_guarded(file_name: str) -> str:
+    manifold = read_and_parse_input_file(file_name)
+    total, engine, nodes_expanded = count_paths_guarded(manifold)
+
+    return f'{total= }, {engine= }, {nodes_expanded= }'
+
+
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input7.txt')}")
     print(f"Part II: {compute_part_two('input/input7.txt')}")
+    print(f"Part I: {compute_part_one_bitset('input/input7.txt')}")
+    print(f"Part II: {compute_part_two_rows('input/input7.txt')}")
+    print(f"Part II: {compute_part_two_stream('input/input7.txt')}")
+    print(f"Part II: {compute_part_two_guarded('input/input7.txt')}")
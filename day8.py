@@ -1,3 +1,4 @@
+import heapq
 import math
 import networkx as nx
 from collections import defaultdict
@@ -185,7 +186,81 @@ def compute_part_two(file_name: str) -> str:
     return f"{x_coordinates= }"
 
 
+class DisjointSet:
+    """
+    Union-find over the points 0..n-1, backed by two lists (parent and size).
+
+    find uses path halving and union attaches the smaller tree to the larger
+    one, so both are close to O(1). The size of every component and the number
+    of components are kept up to date, so nothing has to be recounted.
+    """
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the components of a and b; returns False if they were already one."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def component_sizes(self) -> list[int]:
+        return [self.size[x] for x in range(len(self.parent)) if self.parent[x] == x]
+
+
+def sorted_pairs(points: list[tuple[int, ...]]) -> list[tuple[int, int, float]]:
+    distances = [
+        (i, j, distance(p1, p2))
+        for (i, p1), (j, p2) in combinations(enumerate(points), 2)
+    ]
+    distances.sort(key=lambda x: x[2])
+    return distances
+
+
+def compute_part_one_union_find(file_name: str) -> str:
+    points = read_and_parse_input_file(file_name)
+    circuits = DisjointSet(len(points))
+
+    for p1, p2, _ in sorted_pairs(points)[:1000]:
+        circuits.union(p1, p2)
+
+    top_three = heapq.nlargest(3, circuits.component_sizes())
+    print(f"{top_three= }")
+
+    return f"{math.prod(top_three)= }"
+
+
+def compute_part_two_union_find(file_name: str) -> str:
+    points = read_and_parse_input_file(file_name)
+    circuits = DisjointSet(len(points))
+
+    # Kruskal: the edge that leaves a single component closes the last circuit
+    for p1, p2, _ in sorted_pairs(points):
+        if circuits.union(p1, p2) and circuits.components == 1:
+            break
+    x_coordinates = points[p1][0] * points[p2][0]
+
+    return f"{x_coordinates= }"
+
+
 if __name__ == '__main__':
     print(f"Part I: {compute_part_one('input/input8.txt')}")
     print(f"Part I: {compute_part_one_networkx('input/input8.txt')}")
     print(f"Part II: {compute_part_two('input/input8.txt')}")
+    print(f"Part I: {compute_part_one_union_find('input/input8.txt')}")
+    print(f"Part II: {compute_part_two_union_find('input/input8.txt')}")